@@ -64,6 +64,14 @@ NFL_SEASON_END = 2    # February (next year)
 NFL_REGULAR_SEASON_WEEKS = 18
 NFL_PLAYOFF_WEEKS = 5
 
+# Playoff round names keyed by week number (weeks after the regular season)
+PLAYOFF_WEEK_NAMES = {
+    19: "wildcard",
+    20: "divisional",
+    21: "conference",
+    22: "superbowl",
+}
+
 # ESPN NFL URL patterns
 ESPN_NFL_BASE = "https://www.espn.com/nfl"
 ESPN_NFL_SCORES = f"{ESPN_NFL_BASE}/scoreboard"
@@ -86,18 +94,7 @@ def get_game_data_path(year, week=None, day=None):
 
 def get_week_name(week_num):
     """Convert week number to name"""
-    if 1 <= week_num <= NFL_REGULAR_SEASON_WEEKS:
-        return f"week_{week_num:02d}"
-    elif week_num == 19:
-        return "wildcard"
-    elif week_num == 20:
-        return "divisional"
-    elif week_num == 21:
-        return "conference"
-    elif week_num == 22:
-        return "superbowl"
-    else:
-        return f"week_{week_num:02d}"
+    return PLAYOFF_WEEK_NAMES.get(week_num, f"week_{week_num:02d}")
 
 def ensure_dir(path):
     """Ensure a directory exists"""
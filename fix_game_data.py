@@ -20,34 +20,35 @@ DB_CONFIG = {
     'database': 'football_tracker'
 }
 
+# 2025 Season schedule: week -> game day dates
+WEEK_DATES_2025 = {
+    1: {'thursday': '2025-09-05', 'sunday': '2025-09-08', 'monday': '2025-09-09'},
+    2: {'thursday': '2025-09-12', 'sunday': '2025-09-15', 'monday': '2025-09-16'},
+    3: {'thursday': '2025-09-19', 'sunday': '2025-09-22', 'monday': '2025-09-23'},
+    4: {'thursday': '2025-09-26', 'sunday': '2025-09-29', 'monday': '2025-09-30'},
+    5: {'thursday': '2025-10-03', 'sunday': '2025-10-06', 'monday': '2025-10-07'},
+    6: {'thursday': '2025-10-10', 'sunday': '2025-10-13', 'monday': '2025-10-14'},
+    7: {'thursday': '2025-10-17', 'sunday': '2025-10-20', 'monday': '2025-10-21'},
+    8: {'thursday': '2025-10-24', 'sunday': '2025-10-27', 'monday': '2025-10-28'},
+    9: {'thursday': '2025-10-31', 'sunday': '2025-11-03', 'monday': '2025-11-04'},
+    10: {'thursday': '2025-11-07', 'sunday': '2025-11-10', 'monday': '2025-11-11'},
+    11: {'thursday': '2025-11-14', 'sunday': '2025-11-17', 'monday': '2025-11-18'},
+    12: {'thursday': '2025-11-21', 'sunday': '2025-11-24', 'monday': '2025-11-25'},
+    13: {'thursday': '2025-11-28', 'sunday': '2025-12-01', 'monday': '2025-12-02'},  # Thanksgiving
+    14: {'thursday': '2025-12-05', 'sunday': '2025-12-08', 'monday': '2025-12-09'},
+    15: {'thursday': '2025-12-12', 'sunday': '2025-12-15', 'monday': '2025-12-16'},
+    16: {'thursday': '2025-12-19', 'sunday': '2025-12-22', 'monday': '2025-12-23'},
+    17: {'thursday': '2025-12-26', 'sunday': '2025-12-29', 'monday': '2025-12-30'},
+    18: {'saturday': '2026-01-03', 'sunday': '2026-01-04', 'monday': '2026-01-05'},
+}
+
 def get_week_dates(season, week):
     """
     Calculate actual NFL game dates for a given week
     Week 1 starts first Thursday after September 1st
     """
     if season == 2025:
-        # 2025 Season schedule
-        week_dates = {
-            1: {'thursday': '2025-09-05', 'sunday': '2025-09-08', 'monday': '2025-09-09'},
-            2: {'thursday': '2025-09-12', 'sunday': '2025-09-15', 'monday': '2025-09-16'},
-            3: {'thursday': '2025-09-19', 'sunday': '2025-09-22', 'monday': '2025-09-23'},
-            4: {'thursday': '2025-09-26', 'sunday': '2025-09-29', 'monday': '2025-09-30'},
-            5: {'thursday': '2025-10-03', 'sunday': '2025-10-06', 'monday': '2025-10-07'},
-            6: {'thursday': '2025-10-10', 'sunday': '2025-10-13', 'monday': '2025-10-14'},
-            7: {'thursday': '2025-10-17', 'sunday': '2025-10-20', 'monday': '2025-10-21'},
-            8: {'thursday': '2025-10-24', 'sunday': '2025-10-27', 'monday': '2025-10-28'},
-            9: {'thursday': '2025-10-31', 'sunday': '2025-11-03', 'monday': '2025-11-04'},
-            10: {'thursday': '2025-11-07', 'sunday': '2025-11-10', 'monday': '2025-11-11'},
-            11: {'thursday': '2025-11-14', 'sunday': '2025-11-17', 'monday': '2025-11-18'},
-            12: {'thursday': '2025-11-21', 'sunday': '2025-11-24', 'monday': '2025-11-25'},
-            13: {'thursday': '2025-11-28', 'sunday': '2025-12-01', 'monday': '2025-12-02'},  # Thanksgiving
-            14: {'thursday': '2025-12-05', 'sunday': '2025-12-08', 'monday': '2025-12-09'},
-            15: {'thursday': '2025-12-12', 'sunday': '2025-12-15', 'monday': '2025-12-16'},
-            16: {'thursday': '2025-12-19', 'sunday': '2025-12-22', 'monday': '2025-12-23'},
-            17: {'thursday': '2025-12-26', 'sunday': '2025-12-29', 'monday': '2025-12-30'},
-            18: {'saturday': '2026-01-03', 'sunday': '2026-01-04', 'monday': '2026-01-05'},
-        }
-        return week_dates.get(week, {'sunday': f'2025-09-{7 + (week-1)*7:02d}'})
+        return WEEK_DATES_2025.get(week, {'sunday': f'2025-09-{7 + (week-1)*7:02d}'})
 
     # Default fallback - calculate proper date
     from datetime import datetime, timedelta
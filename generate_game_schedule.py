@@ -5,10 +5,14 @@ Generate game schedule data from processed URL files and CSV data
 
 import json
 import os
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 import re
 
+# Week number in CSV filenames: nfl_TEAM_category_week#_date_gameid.csv
+CSV_WEEK_RE = re.compile(r'week(\d+)_')
+
 def get_game_info_from_url(url):
     """Extract game ID and teams from ESPN URL"""
     game_id_match = re.search(r'/(\d+)(?:/|$)', url)
@@ -37,16 +41,32 @@ def parse_url_file(file_path):
     
     return games
 
-def extract_matchups_from_csv_files(csv_dir, games_dict, week):
-    """Extract team matchups from CSV filenames"""
+def index_csv_files_by_week(csv_dir):
+    """Scan the CSV directory once and group filenames by week number"""
+    files_by_week = defaultdict(list)
     csv_path = Path(csv_dir)
     
+    if not csv_path.exists():
+        return files_by_week
+    
+    with os.scandir(csv_path) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.csv'):
+                continue
+            week_match = CSV_WEEK_RE.search(entry.name)
+            if week_match:
+                files_by_week[int(week_match.group(1))].append(entry.name)
+    
+    return files_by_week
+
+def extract_matchups_from_csv_files(csv_filenames, games_dict, week):
+    """Extract team matchups from CSV filenames"""
     # Track which teams played in each game
     game_teams = {}
     
-    for csv_file in csv_path.glob(f'*week{week}_*.csv'):
+    for csv_filename in csv_filenames:
         # Parse filename: nfl_TEAM_category_week#_date_gameid.csv
-        parts = csv_file.stem.split('_')
+        parts = csv_filename[:-len('.csv')].split('_')
         if len(parts) >= 6:
             team = parts[1]
             game_id = parts[-1]
@@ -87,6 +107,9 @@ def generate_schedule_files(output_dir):
     # Create output directory
     output_path.mkdir(parents=True, exist_ok=True)
     
+    # List the CSV directory once instead of globbing it for every week
+    csv_files_by_week = index_csv_files_by_week(csv_dir)
+    
     # Process each week's URL file
     for url_file in scraper_dir.glob('regular_week*.txt'):
         # Extract week number from filename
@@ -99,7 +122,7 @@ def generate_schedule_files(output_dir):
             games = parse_url_file(url_file)
             
             # Extract matchups from CSV files
-            games = extract_matchups_from_csv_files(csv_dir, games, week)
+            games = extract_matchups_from_csv_files(csv_files_by_week.get(week, []), games, week)
             
             # Create schedule data
             schedule = {
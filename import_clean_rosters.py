@@ -5,6 +5,7 @@ Import clean NFL roster data from CSV to database
 
 import csv
 import psycopg2
+from psycopg2.extras import execute_values
 from pathlib import Path
 from datetime import datetime
 
@@ -31,6 +32,8 @@ with open(roster_file, 'r', encoding='utf-8') as f:
     
     total = 0
     errors = 0
+    roster_rows = {}
+    scraped_date = datetime.now()
     
     for row in reader:
         try:
@@ -67,27 +70,12 @@ with open(roster_file, 'r', encoding='utf-8') as f:
             if position and len(position) > 10:
                 position = position[:10]
             
-            # Insert into database
-            cur.execute("""
-                INSERT INTO nfl_rosters (
-                    team, name, jersey, position, age, height, weight, 
-                    experience, college, roster_section, scraped_date
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (name, team) DO UPDATE SET
-                    jersey = EXCLUDED.jersey,
-                    position = EXCLUDED.position,
-                    age = EXCLUDED.age,
-                    height = EXCLUDED.height,
-                    weight = EXCLUDED.weight,
-                    experience = EXCLUDED.experience,
-                    college = EXCLUDED.college,
-                    roster_section = EXCLUDED.roster_section,
-                    scraped_date = EXCLUDED.scraped_date,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (
+            # Queue for bulk insert; a later row for the same (name, team) wins,
+            # since ON CONFLICT cannot touch the same row twice in one statement
+            roster_rows[(name, team)] = (
                 team, name, jersey, position, age, height, weight,
-                experience, college, roster_section, datetime.now()
-            ))
+                experience, college, roster_section, scraped_date
+            )
             
             total += 1
             if total % 100 == 0:
@@ -98,6 +86,26 @@ with open(roster_file, 'r', encoding='utf-8') as f:
             print(f"Error processing {row.get('name', 'unknown')}: {e}")
             continue
 
+# Insert all rows in batches
+print(f"Inserting {len(roster_rows)} roster rows...")
+execute_values(cur, """
+    INSERT INTO nfl_rosters (
+        team, name, jersey, position, age, height, weight, 
+        experience, college, roster_section, scraped_date
+    ) VALUES %s
+    ON CONFLICT (name, team) DO UPDATE SET
+        jersey = EXCLUDED.jersey,
+        position = EXCLUDED.position,
+        age = EXCLUDED.age,
+        height = EXCLUDED.height,
+        weight = EXCLUDED.weight,
+        experience = EXCLUDED.experience,
+        college = EXCLUDED.college,
+        roster_section = EXCLUDED.roster_section,
+        scraped_date = EXCLUDED.scraped_date,
+        updated_at = CURRENT_TIMESTAMP
+""", list(roster_rows.values()), page_size=500)
+
 # Commit all changes
 conn.commit()
 
@@ -17,11 +17,10 @@ DB_CONFIG = {
     'password': 'korn5676'
 }
 
-def get_team_id(cursor, team_abbr):
-    """Get team ID from abbreviation"""
-    cursor.execute("SELECT id FROM teams WHERE abbreviation = %s", (team_abbr,))
-    result = cursor.fetchone()
-    return result[0] if result else None
+def load_team_ids(cursor):
+    """Load abbreviation -> team ID mapping for all teams"""
+    cursor.execute("SELECT abbreviation, id FROM teams")
+    return dict(cursor.fetchall())
 
 def import_schedule_files():
     """Import all regular season schedule files"""
@@ -31,6 +30,8 @@ def import_schedule_files():
     cursor = conn.cursor()
     
     try:
+        team_ids = load_team_ids(cursor)
+        
         # Find all regular season summary files
         summary_files = glob.glob("regular_week*_2025_summary.json")
         summary_files.sort()
@@ -52,8 +53,8 @@ def import_schedule_files():
                 week = game['week']
                 
                 # Get team IDs
-                home_team_id = get_team_id(cursor, home_team)
-                away_team_id = get_team_id(cursor, away_team)
+                home_team_id = team_ids.get(home_team)
+                away_team_id = team_ids.get(away_team)
                 
                 if not home_team_id or not away_team_id:
                     print(f"  Skipping {game_id}: Unknown teams {home_team}/{away_team}")
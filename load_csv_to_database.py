@@ -7,7 +7,6 @@ Properly associates player stats with games and updates game scores
 import os
 import csv
 import psycopg2
-from psycopg2.extras import RealDictCursor
 import re
 from pathlib import Path
 import logging
@@ -25,7 +24,7 @@ class CSVDatabaseLoader:
             password=os.getenv('DB_PASSWORD', 'korn5676'),
             port=int(os.getenv('DB_PORT', 5432))
         )
-        self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        self.cursor = self.conn.cursor()
         
     def map_team_from_stat_category(self, team_abbr, stat_category, filename=None):
         """Map team abbreviation based on stat category for special cases"""
@@ -68,7 +67,7 @@ class CSVDatabaseLoader:
         result = self.cursor.fetchone()
         
         if result:
-            return result['id']
+            return result[0]
         
         # Create team if not exists
         logger.warning(f"Creating new team: {team_abbr}")
@@ -78,7 +77,7 @@ class CSVDatabaseLoader:
             RETURNING id
         """, (team_abbr, team_abbr))
         self.conn.commit()
-        return self.cursor.fetchone()['id']
+        return self.cursor.fetchone()[0]
     
     def get_or_create_player(self, player_name, team_id, position):
         """Get player ID, creating if necessary"""
@@ -90,7 +89,7 @@ class CSVDatabaseLoader:
         result = self.cursor.fetchone()
         
         if result:
-            return result['id']
+            return result[0]
         
         # Create player if not exists
         logger.info(f"Creating new player: {player_name} ({position})")
@@ -100,7 +99,7 @@ class CSVDatabaseLoader:
             RETURNING id
         """, (player_name, team_id, position, 0))
         self.conn.commit()
-        return self.cursor.fetchone()['id']
+        return self.cursor.fetchone()[0]
     
     def get_or_create_game(self, game_id, season, week, season_type):
         """Get or create game record"""
@@ -109,7 +108,7 @@ class CSVDatabaseLoader:
         result = self.cursor.fetchone()
         
         if result:
-            return result['id']
+            return result[0]
         
         # Create placeholder game with current date
         logger.info(f"Creating game record: {game_id}")
@@ -119,7 +118,7 @@ class CSVDatabaseLoader:
             RETURNING id
         """, (game_id, season, week, season_type))
         self.conn.commit()
-        return self.cursor.fetchone()['id']
+        return self.cursor.fetchone()[0]
     
     def determine_position(self, stat_category):
         """Determine position based on stat category"""
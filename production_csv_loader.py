@@ -15,7 +15,6 @@ import csv
 import re
 import logging
 import psycopg2
-from psycopg2.extras import RealDictCursor
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -32,7 +31,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Official NFL team abbreviations for validation
-OFFICIAL_NFL_TEAMS = {
+OFFICIAL_NFL_TEAMS = frozenset({
     "BUF", "MIA", "NE", "NYJ",  # AFC East
     "BAL", "CIN", "CLE", "PIT",  # AFC North  
     "HOU", "IND", "JAX", "TEN",  # AFC South
@@ -41,7 +40,7 @@ OFFICIAL_NFL_TEAMS = {
     "CHI", "DET", "GB", "MIN",   # NFC North
     "ATL", "CAR", "NO", "TB",    # NFC South
     "ARI", "LAR", "SF", "SEA"    # NFC West
-}
+})
 
 class ProductionCSVLoader:
     def __init__(self, db_config: Dict = None):
@@ -60,6 +59,8 @@ class ProductionCSVLoader:
         self.cursor = None
         self.stats_loaded = 0
         self.errors = []
+        self._team_ids = {}  # abbreviation -> teams.id, filled as files are loaded
+        self._game_ids = {}  # ESPN game_id -> games.id, preloaded per season
         
         # Connect to database
         self._connect()
@@ -68,7 +69,7 @@ class ProductionCSVLoader:
         """Connect to PostgreSQL database"""
         try:
             self.conn = psycopg2.connect(**self.db_config)
-            self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+            self.cursor = self.conn.cursor()
             logger.info(f"Connected to database: {self.db_config['database']}")
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
@@ -114,13 +115,18 @@ class ProductionCSVLoader:
             logger.error(f"Invalid team abbreviation: {team_abbr}")
             return None
         
+        # Every CSV for a team asks again, so answer repeats from memory
+        if team_abbr in self._team_ids:
+            return self._team_ids[team_abbr]
+        
         try:
             # Check if team exists
             self.cursor.execute("SELECT id FROM teams WHERE abbreviation = %s", (team_abbr,))
             result = self.cursor.fetchone()
             
             if result:
-                return result['id']
+                self._team_ids[team_abbr] = result[0]
+                return result[0]
             
             # Create team if not exists
             logger.info(f"Creating new team: {team_abbr}")
@@ -130,7 +136,8 @@ class ProductionCSVLoader:
                 RETURNING id
             """, (team_abbr, team_abbr))
             
-            return self.cursor.fetchone()['id']
+            self._team_ids[team_abbr] = self.cursor.fetchone()[0]
+            return self._team_ids[team_abbr]
             
         except Exception as e:
             logger.error(f"Error getting/creating team {team_abbr}: {e}")
@@ -147,7 +154,7 @@ class ProductionCSVLoader:
             result = self.cursor.fetchone()
             
             if result:
-                return result['id']
+                return result[0]
             
             # Determine position from stat category if not provided
             if not position:
@@ -161,7 +168,7 @@ class ProductionCSVLoader:
                 RETURNING id
             """, (player_name, team_id, position, 0))
             
-            return self.cursor.fetchone()['id']
+            return self.cursor.fetchone()[0]
             
         except Exception as e:
             logger.error(f"Error getting/creating player {player_name}: {e}")
@@ -169,13 +176,17 @@ class ProductionCSVLoader:
     
     def get_or_create_game(self, game_id: str, season: int, week: int, season_type: str = 'regular') -> Optional[int]:
         """Get or create game record and return the database ID"""
+        if game_id in self._game_ids:
+            return self._game_ids[game_id]
+
         try:
             # Check if game exists by ESPN game_id
             self.cursor.execute("SELECT id FROM games WHERE game_id = %s", (game_id,))
             result = self.cursor.fetchone()
 
             if result:
-                return result['id']
+                self._game_ids[game_id] = result[0]
+                return result[0]
 
             # Determine teams from CSV files for this game
             teams_in_game = self.determine_teams_for_game(game_id, week)
@@ -203,12 +214,19 @@ class ProductionCSVLoader:
                 RETURNING id
             """, (game_id, season, week, season_type, home_team_id, away_team_id))
 
-            return self.cursor.fetchone()['id']
+            self._game_ids[game_id] = self.cursor.fetchone()[0]
+            return self._game_ids[game_id]
 
         except Exception as e:
             logger.error(f"Error getting/creating game {game_id}: {e}")
             return None
 
+    def preload_game_ids(self, season: int):
+        """Load the season's ESPN game_id -> database ID mapping in one query"""
+        self.cursor.execute("SELECT game_id, id FROM games WHERE season = %s", (season,))
+        self._game_ids.update((str(game_id), db_id) for game_id, db_id in self.cursor.fetchall())
+        logger.info(f"Preloaded {len(self._game_ids)} game IDs for season {season}")
+
     def determine_teams_for_game(self, game_id: str, week: int) -> set:
         """Determine which teams play in a game by scanning CSV files"""
         teams = set()
@@ -507,6 +525,9 @@ class ProductionCSVLoader:
         processed_files = 0
 
         try:
+            # Resolve existing games up front instead of one SELECT per file
+            self.preload_game_ids(season)
+
             for csv_file in csv_files:
                 records = self.process_csv_file(csv_file, season)
                 if records > 0:
@@ -535,8 +556,10 @@ class ProductionCSVLoader:
             }
             
         except Exception as e:
-            # Rollback on error
+            # Rollback on error; IDs of teams created in this transaction are gone too
             self.conn.rollback()
+            self._team_ids.clear()
+            self._game_ids.clear()
             logger.error(f"Transaction failed, rolling back: {e}")
             
             return {
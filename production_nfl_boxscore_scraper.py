@@ -12,15 +12,17 @@ Features:
 
 import os
 import re
+import csv
 import time
 import random
 import logging
 import requests
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse, parse_qs
 
 # Setup logging
@@ -100,14 +102,59 @@ TEAM_CITY_MAPPING = {
     "san francisco": "SF", "francisco": "SF",
 }
 
+# Date patterns used by extract_game_date, compiled once at import
+TITLE_DATE_RE = re.compile(r'\(([A-Za-z]+ \d+, \d{4})\)')
+SCRIPT_GAME_DATE_RE = re.compile(r'"gameDate"\s*:\s*"(\d{4}-\d{2}-\d{2})')
+SCRIPT_LONG_DATE_RE = re.compile(r'"date"\s*:\s*"([A-Za-z]+ \d+, \d{4})"')
+GAME_DATE_CLASS_RE = re.compile(r'game.*date|date.*game', re.I)
+TEXT_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4}|\w+\s+\d{1,2},\s+\d{4})')
+BREADCRUMB_CLASS_RE = re.compile(r'breadcrumb|nav', re.I)
+SLASH_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+META_DATE_PROPERTY_RE = re.compile(r'date', re.I)
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+URL_DATE_RE = re.compile(r'\d{8}')
+
+# Page and URL patterns used while scraping each game
+CLUBHOUSE_UID_RE = re.compile(r's:20~l:28~t:\d+')
+TEAM_SLUG_RE = re.compile(r'/name/([^/]+)/')
+NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+GAME_ID_RE = re.compile(r'/gameId/(\d+)')
+
+# Standardize ESPN stat category names for CSV filenames
+STAT_CATEGORY_MAPPING = {
+    'kick_returns': 'kick_returns',
+    'punt_returns': 'punt_returns', 
+    'field_goals': 'kicking',
+    'fg': 'kicking',
+    'interceptions': 'interceptions',
+    'int': 'interceptions',
+    'sacks': 'defensive',
+    'tackles': 'defensive'
+}
+
 class ProductionNFLBoxscoreScraper:
     def __init__(self, output_dir: str = None):
         """Initialize the production scraper"""
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate'
         })
         
+        # Keep ESPN connections alive across games and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET']
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Set output directory to BOXSCORE_CSV
         if output_dir is None:
             current_dir = Path(__file__).parent
@@ -122,6 +169,9 @@ class ProductionNFLBoxscoreScraper:
         self.processed_games = []
         self.failed_games = []
         
+        # CSV filenames already in the output directory, listed on first use
+        self._existing_csvs = None
+        
     def _identify_teams_from_page(self, soup: BeautifulSoup, game_info: Dict) -> List[str]:
         """
         Try to identify which teams are playing from various page elements
@@ -129,12 +179,12 @@ class ProductionNFLBoxscoreScraper:
         teams = []
         
         # Try to get teams from the scoreboard/gamestrip
-        scoreboards = soup.find_all('a', {'data-clubhouse-uid': re.compile(r's:20~l:28~t:\d+')})
+        scoreboards = soup.find_all('a', {'data-clubhouse-uid': CLUBHOUSE_UID_RE})
         for link in scoreboards:
             href = link.get('href', '')
             if '/nfl/team/_/name/' in href:
                 # Extract team abbreviation from URL like /nfl/team/_/name/lac/los-angeles-chargers
-                match = re.search(r'/name/([^/]+)/', href)
+                match = TEAM_SLUG_RE.search(href)
                 if match:
                     team_abbr = match.group(1).upper()
                     if team_abbr not in teams:
@@ -273,7 +323,7 @@ class ProductionNFLBoxscoreScraper:
             if title_tag:
                 title_text = title_tag.get_text()
                 # ESPN title format: "Team vs Team (Sep 14, 2025) Box Score - ESPN"
-                date_match = re.search(r'\(([A-Za-z]+ \d+, \d{4})\)', title_text)
+                date_match = TITLE_DATE_RE.search(title_text)
                 if date_match:
                     date_str = date_match.group(1)
                     # Parse abbreviated month format
@@ -289,14 +339,14 @@ class ProductionNFLBoxscoreScraper:
             for script in scripts:
                 if script.string:
                     # Look for patterns like "gameDate":"2025-09-14T17:00Z"
-                    date_match = re.search(r'"gameDate"\s*:\s*"(\d{4}-\d{2}-\d{2})', script.string)
+                    date_match = SCRIPT_GAME_DATE_RE.search(script.string)
                     if date_match:
                         date_str = date_match.group(1)
                         parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
                         return parsed_date.strftime('%Y%m%d')
 
                     # Also try "date":"September 14, 2025" format
-                    date_match = re.search(r'"date"\s*:\s*"([A-Za-z]+ \d+, \d{4})"', script.string)
+                    date_match = SCRIPT_LONG_DATE_RE.search(script.string)
                     if date_match:
                         date_str = date_match.group(1)
                         try:
@@ -326,10 +376,10 @@ class ProductionNFLBoxscoreScraper:
                         pass
             
             # Method 1: Look for game info date
-            game_info_sections = soup.find_all(['div', 'span'], class_=re.compile(r'game.*date|date.*game', re.I))
+            game_info_sections = soup.find_all(['div', 'span'], class_=GAME_DATE_CLASS_RE)
             for section in game_info_sections:
                 text = section.get_text().strip()
-                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4}|\w+\s+\d{1,2},\s+\d{4})', text)
+                date_match = TEXT_DATE_RE.search(text)
                 if date_match:
                     date_str = date_match.group(1)
                     try:
@@ -342,10 +392,10 @@ class ProductionNFLBoxscoreScraper:
                         continue
             
             # Method 2: Check breadcrumb or navigation
-            breadcrumbs = soup.find_all(['nav', 'div'], class_=re.compile(r'breadcrumb|nav', re.I))
+            breadcrumbs = soup.find_all(['nav', 'div'], class_=BREADCRUMB_CLASS_RE)
             for breadcrumb in breadcrumbs:
                 text = breadcrumb.get_text().strip()
-                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', text)
+                date_match = SLASH_DATE_RE.search(text)
                 if date_match:
                     try:
                         parsed_date = datetime.strptime(date_match.group(1), '%m/%d/%Y')
@@ -354,10 +404,10 @@ class ProductionNFLBoxscoreScraper:
                         continue
             
             # Method 3: Check meta tags
-            meta_tags = soup.find_all('meta', attrs={'property': re.compile(r'date', re.I)})
+            meta_tags = soup.find_all('meta', attrs={'property': META_DATE_PROPERTY_RE})
             for meta in meta_tags:
                 content = meta.get('content', '')
-                if content and re.match(r'\d{4}-\d{2}-\d{2}', content):
+                if content and ISO_DATE_RE.match(content):
                     try:
                         parsed_date = datetime.strptime(content[:10], '%Y-%m-%d')
                         return parsed_date.strftime('%Y%m%d')
@@ -367,7 +417,7 @@ class ProductionNFLBoxscoreScraper:
             # Method 4: URL pattern analysis
             if 'date=' in game_url:
                 url_date = parse_qs(urlparse(game_url).query).get('date', [''])[0]
-                if url_date and re.match(r'\d{8}', url_date):
+                if url_date and URL_DATE_RE.match(url_date):
                     return url_date
             
             logger.warning(f"Could not extract game date from {game_url}")
@@ -387,22 +437,11 @@ class ProductionNFLBoxscoreScraper:
             
         # Convert to lowercase and replace spaces with underscores
         cleaned = category.lower().strip()
-        cleaned = re.sub(r'[^a-z0-9]+', '_', cleaned)
+        cleaned = NON_ALNUM_RE.sub('_', cleaned)
         cleaned = cleaned.strip('_')
         
         # Standardize common categories
-        category_mapping = {
-            'kick_returns': 'kick_returns',
-            'punt_returns': 'punt_returns', 
-            'field_goals': 'kicking',
-            'fg': 'kicking',
-            'interceptions': 'interceptions',
-            'int': 'interceptions',
-            'sacks': 'defensive',
-            'tackles': 'defensive'
-        }
-        
-        return category_mapping.get(cleaned, cleaned)
+        return STAT_CATEGORY_MAPPING.get(cleaned, cleaned)
     
     def scrape_game_boxscore(self, game_info: Dict) -> Optional[Dict]:
         """
@@ -420,7 +459,7 @@ class ProductionNFLBoxscoreScraper:
             response = self.session.get(boxscore_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
             
             # Extract actual game date
             game_date = self.extract_game_date(soup, boxscore_url)
@@ -570,6 +609,21 @@ class ProductionNFLBoxscoreScraper:
             logger.error(f"Error extracting player stats for {team_abbr} {stat_category}: {e}")
             return []
     
+    def _find_existing_csv(self, prefix: str, suffix: str) -> Optional[str]:
+        """
+        Return an existing output filename shaped like {prefix}*{suffix}, if any.
+        The directory is listed once per scraper run, not once per file saved.
+        """
+        if self._existing_csvs is None:
+            with os.scandir(self.output_dir) as entries:
+                self._existing_csvs = {entry.name for entry in entries if entry.name.endswith('.csv')}
+        
+        min_length = len(prefix) + len(suffix)
+        for name in self._existing_csvs:
+            if len(name) >= min_length and name.startswith(prefix) and name.endswith(suffix):
+                return name
+        return None
+    
     def save_statistics_to_csv(self, all_teams_data: Dict, game_info: Dict) -> List[str]:
         """
         Save statistics to clean CSV files with proper naming
@@ -588,18 +642,24 @@ class ProductionNFLBoxscoreScraper:
                 csv_path = self.output_dir / filename
                 
                 # Check if file already exists for this game ID (regardless of date in filename)
-                existing_pattern = f"nfl_{team_abbr}_{stat_category}_week{game_info['week']}_*_{game_info['game_id']}.csv"
-                existing_files = list(self.output_dir.glob(existing_pattern))
+                existing_name = self._find_existing_csv(
+                    f"nfl_{team_abbr}_{stat_category}_week{game_info['week']}_",
+                    f"_{game_info['game_id']}.csv"
+                )
                 
-                if existing_files:
-                    logger.warning(f"Skipping {filename} - file already exists for this game: {existing_files[0].name}")
-                    created_files.append(str(existing_files[0]))  # Add existing file to list
+                if existing_name:
+                    logger.warning(f"Skipping {filename} - file already exists for this game: {existing_name}")
+                    created_files.append(str(self.output_dir / existing_name))  # Add existing file to list
                     continue
                 
                 try:
-                    # Create DataFrame and save
-                    df = pd.DataFrame(player_stats)
-                    df.to_csv(csv_path, index=False, encoding='utf-8')
+                    # Columns are the union of all player keys, in first-seen order
+                    fieldnames = list(dict.fromkeys(key for player in player_stats for key in player))
+                    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=65536) as f:
+                        writer = csv.DictWriter(f, fieldnames=fieldnames, restval='', lineterminator='\n')
+                        writer.writeheader()
+                        writer.writerows(player_stats)
+                    self._existing_csvs.add(filename)
                     created_files.append(str(csv_path))
                     
                     logger.info(f"Saved {len(player_stats)} {stat_category} records for {team_abbr} to {filename}")
@@ -609,54 +669,22 @@ class ProductionNFLBoxscoreScraper:
         
         return created_files
     
+    def _parse_game_url(self, game_url: str) -> Optional[str]:
+        """
+        Extract the numeric ESPN game ID from a game URL (e.g. .../game/_/gameId/401772936/...)
+        """
+        match = GAME_ID_RE.search(game_url)
+        if not match:
+            logger.warning(f"Could not extract game ID from URL: {game_url}")
+            return None
+        return match.group(1)
+    
     def process_games_from_urls(self, game_urls: List[str], season: int = 2025, week: int = 1) -> Dict:
         """
         Process multiple games from URL list
         """
-        logger.info(f"Processing {len(game_urls)} games for Season {season}, Week {week}")
-        
-        all_created_files = []
-        
-        for i, game_url in enumerate(game_urls, 1):
-            logger.info(f"Processing game {i}/{len(game_urls)}: {game_url}")
-            
-            # Extract game ID from URL
-            game_id_match = re.search(r'/gameId/(\d+)', game_url)
-            if not game_id_match:
-                logger.warning(f"Could not extract game ID from URL: {game_url}")
-                continue
-            
-            game_info = {
-                'game_id': game_id_match.group(1),
-                'game_url': game_url,
-                'season': season,
-                'week': week,
-                'status': 'completed'
-            }
-            
-            # Scrape game
-            teams_data = self.scrape_game_boxscore(game_info)
-            if teams_data:
-                created_files = self.save_statistics_to_csv(teams_data, game_info)
-                all_created_files.extend(created_files)
-        
-        # Generate summary
-        summary = {
-            'success': True,
-            'season': season,
-            'week': week,
-            'total_games': len(game_urls),
-            'processed': len(self.processed_games),
-            'failed': len(self.failed_games),
-            'created_files': all_created_files,
-            'processed_games': self.processed_games,
-            'failed_games': self.failed_games
-        }
-        
-        logger.info(f"Processing complete: {summary['processed']}/{summary['total_games']} games processed")
-        logger.info(f"Created {len(all_created_files)} CSV files")
-        
-        return summary
+        url_data = [{'url': game_url} for game_url in game_urls]
+        return self.process_games_with_dates(url_data, season, week)
     
     def process_games_with_dates(self, url_data: List[Dict], season: int = 2025, week: int = 1) -> Dict:
         """
@@ -674,14 +702,12 @@ class ProductionNFLBoxscoreScraper:
             if game_date:
                 logger.info(f"Using game date: {game_date}")
             
-            # Extract game ID from URL
-            game_id_match = re.search(r'/gameId/(\d+)', game_url)
-            if not game_id_match:
-                logger.warning(f"Could not extract game ID from URL: {game_url}")
+            game_id = self._parse_game_url(game_url)
+            if not game_id:
                 continue
             
             game_info = {
-                'game_id': game_id_match.group(1),
+                'game_id': game_id,
                 'game_url': game_url,
                 'season': season,
                 'week': week,
@@ -60,6 +60,12 @@ def main():
         os.makedirs(output_dir)
 
     for game_id in game_ids:
+        # Resume support: games already moved into PBP_CSV were finished by a previous run
+        destination_file = os.path.join(output_dir, f'play_by_play_{game_id}.csv')
+        if os.path.exists(destination_file):
+            print(f"Skipping game_id {game_id}: {destination_file} already exists")
+            continue
+
         print(f"Scraping play-by-play data for game_id: {game_id}")
         
         # Path to the original scraper script
@@ -78,7 +84,6 @@ def main():
 
             # Move the generated file
             source_file = os.path.join(scraper_dir, f'play_by_play_{game_id}.csv')
-            destination_file = os.path.join(output_dir, f'play_by_play_{game_id}.csv')
 
             if os.path.exists(source_file):
                 shutil.move(source_file, destination_file)
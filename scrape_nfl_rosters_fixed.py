@@ -13,6 +13,26 @@ from datetime import datetime
 import time
 import re
 
+# NFL team mappings (abbreviation -> full name), shared by all scraper instances
+NFL_TEAM_NAMES = {
+    'ARI': 'Arizona Cardinals', 'ATL': 'Atlanta Falcons',
+    'BAL': 'Baltimore Ravens', 'BUF': 'Buffalo Bills',
+    'CAR': 'Carolina Panthers', 'CHI': 'Chicago Bears',
+    'CIN': 'Cincinnati Bengals', 'CLE': 'Cleveland Browns',
+    'DAL': 'Dallas Cowboys', 'DEN': 'Denver Broncos',
+    'DET': 'Detroit Lions', 'GB': 'Green Bay Packers',
+    'HOU': 'Houston Texans', 'IND': 'Indianapolis Colts',
+    'JAX': 'Jacksonville Jaguars', 'KC': 'Kansas City Chiefs',
+    'LAC': 'Los Angeles Chargers', 'LAR': 'Los Angeles Rams',
+    'LV': 'Las Vegas Raiders', 'MIA': 'Miami Dolphins',
+    'MIN': 'Minnesota Vikings', 'NE': 'New England Patriots',
+    'NO': 'New Orleans Saints', 'NYG': 'New York Giants',
+    'NYJ': 'New York Jets', 'PHI': 'Philadelphia Eagles',
+    'PIT': 'Pittsburgh Steelers', 'SEA': 'Seattle Seahawks',
+    'SF': 'San Francisco 49ers', 'TB': 'Tampa Bay Buccaneers',
+    'TEN': 'Tennessee Titans', 'WAS': 'Washington Commanders'
+}
+
 class NFLRosterScraperFixed:
     def __init__(self):
         self.base_url = "https://www.espn.com"
@@ -20,36 +40,28 @@ class NFLRosterScraperFixed:
         self.output_dir = Path("../FootballData/rosters")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # NFL team mappings
-        self.team_names = {
-            'ARI': 'Arizona Cardinals', 'ATL': 'Atlanta Falcons',
-            'BAL': 'Baltimore Ravens', 'BUF': 'Buffalo Bills',
-            'CAR': 'Carolina Panthers', 'CHI': 'Chicago Bears',
-            'CIN': 'Cincinnati Bengals', 'CLE': 'Cleveland Browns',
-            'DAL': 'Dallas Cowboys', 'DEN': 'Denver Broncos',
-            'DET': 'Detroit Lions', 'GB': 'Green Bay Packers',
-            'HOU': 'Houston Texans', 'IND': 'Indianapolis Colts',
-            'JAX': 'Jacksonville Jaguars', 'KC': 'Kansas City Chiefs',
-            'LAC': 'Los Angeles Chargers', 'LAR': 'Los Angeles Rams',
-            'LV': 'Las Vegas Raiders', 'MIA': 'Miami Dolphins',
-            'MIN': 'Minnesota Vikings', 'NE': 'New England Patriots',
-            'NO': 'New Orleans Saints', 'NYG': 'New York Giants',
-            'NYJ': 'New York Jets', 'PHI': 'Philadelphia Eagles',
-            'PIT': 'Pittsburgh Steelers', 'SEA': 'Seattle Seahawks',
-            'SF': 'San Francisco 49ers', 'TB': 'Tampa Bay Buccaneers',
-            'TEN': 'Tennessee Titans', 'WAS': 'Washington Commanders'
-        }
-        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        
+        # Raw bodies of successful page fetches, keyed by URL
+        self._html_cache = {}
+
+    def _fetch_html(self, url):
+        """Fetch a page body, reusing the cached copy of a successful response"""
+        if url in self._html_cache:
+            return self._html_cache[url]
+        
+        response = self.session.get(url)
+        if response.ok:
+            self._html_cache[url] = response.content
+        return response.content
 
     def get_team_roster_url(self, team_page_url):
         """Get the roster URL from a team's main page"""
         try:
-            response = self.session.get(team_page_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self._fetch_html(team_page_url), 'lxml')
             
             # Find the roster link
             roster_link = soup.find('a', {'class': 'AnchorLink', 'href': re.compile(r'/roster')})
@@ -71,8 +83,7 @@ class NFLRosterScraperFixed:
         print(f"\nScraping {team_abbr} roster from: {roster_url}")
         
         try:
-            response = self.session.get(roster_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self._fetch_html(roster_url), 'lxml')
             
             players = []
             
@@ -190,10 +201,10 @@ class NFLRosterScraperFixed:
         print("Getting all NFL team pages...")
         
         try:
-            response = self.session.get(self.teams_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self._fetch_html(self.teams_url), 'lxml')
             
             teams = []
+            seen_abbrs = set()
             
             # Find all team links
             team_links = soup.find_all('a', class_=re.compile(r'AnchorLink'), href=re.compile(r'/nfl/team/_/'))
@@ -208,11 +219,12 @@ class NFLRosterScraperFixed:
                     team_url = self.base_url + href
                     
                     # Skip duplicates
-                    if not any(t['abbr'] == team_abbr for t in teams):
+                    if team_abbr not in seen_abbrs:
+                        seen_abbrs.add(team_abbr)
                         teams.append({
                             'abbr': team_abbr,
                             'url': team_url,
-                            'name': self.team_names.get(team_abbr, team_abbr)
+                            'name': NFL_TEAM_NAMES.get(team_abbr, team_abbr)
                         })
             
             print(f"Found {len(teams)} teams")
@@ -231,7 +243,7 @@ class NFLRosterScraperFixed:
             # Fallback to hardcoded teams
             teams = [
                 {'abbr': abbr, 'name': name, 'url': f"{self.base_url}/nfl/team/roster/_/name/{abbr.lower()}"}
-                for abbr, name in self.team_names.items()
+                for abbr, name in NFL_TEAM_NAMES.items()
             ]
         
         all_players = []
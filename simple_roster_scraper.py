@@ -13,24 +13,37 @@ from datetime import datetime
 import time
 import re
 
+# NFL team abbreviations, shared by all scraper instances
+NFL_TEAMS = (
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE',
+    'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC',
+    'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+    'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS'
+)
+
 class SimpleRosterScraper:
     def __init__(self):
         self.base_url = "https://www.espn.com"
         self.output_dir = Path("../FootballData/rosters")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # NFL team abbreviations
-        self.teams = [
-            'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE',
-            'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC',
-            'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
-            'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS'
-        ]
-        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        
+        # Raw bodies of successful page fetches, keyed by URL
+        self._html_cache = {}
+
+    def _fetch_html(self, url):
+        """Fetch a page body, reusing the cached copy of a successful response"""
+        if url in self._html_cache:
+            return self._html_cache[url]
+        
+        response = self.session.get(url)
+        if response.ok:
+            self._html_cache[url] = response.content
+        return response.content
 
     def parse_name_and_jersey(self, text):
         """Parse combined name and jersey like 'Josh Allen17' -> ('Josh Allen', '17')"""
@@ -47,8 +60,7 @@ class SimpleRosterScraper:
         print(f"Scraping {team_abbr} from: {roster_url}")
         
         try:
-            response = self.session.get(roster_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self._fetch_html(roster_url), 'lxml')
             
             players = []
             
@@ -122,7 +134,7 @@ class SimpleRosterScraper:
         all_players = []
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        for team in self.teams:
+        for team in NFL_TEAMS:
             players = self.scrape_team_roster(team)
             
             if players:
@@ -13,36 +13,34 @@ from pathlib import Path
 def parse_game_file(file_path):
     """Parse the game file and extract games with their timestamps"""
     games = []
+    # (teams, timestamp) from the previous line when it was a timestamped comment
+    pending = None
     
+    # Stream the file line by line; a game only needs its comment and the URL after it
     with open(file_path, 'r') as f:
-        lines = f.readlines()
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Look for comment lines with timestamps
-        if line.startswith('#') and ' - ' in line and 'Z' in line:
-            # Extract timestamp from comment
-            timestamp_match = re.search(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}Z)', line)
-            if timestamp_match:
-                timestamp_str = timestamp_match.group(1)
-                teams = line.split(' - ')[0].replace('#', '').strip()
-                
-                # Next line should be the URL
-                if i + 1 < len(lines):
-                    url_line = lines[i + 1].strip()
-                    if url_line.startswith('https://www.espn.com/nfl/game/'):
-                        game_id_match = re.search(r'gameId/(\d+)', url_line)
-                        if game_id_match:
-                            game_id = game_id_match.group(1)
-                            games.append({
-                                'teams': teams,
-                                'timestamp': timestamp_str,
-                                'url': url_line,
-                                'game_id': game_id
-                            })
-        i += 1
+        for line in f:
+            line = line.strip()
+            
+            # URL line directly following a timestamped comment
+            if pending and line.startswith('https://www.espn.com/nfl/game/'):
+                game_id_match = re.search(r'gameId/(\d+)', line)
+                if game_id_match:
+                    teams, timestamp_str = pending
+                    games.append({
+                        'teams': teams,
+                        'timestamp': timestamp_str,
+                        'url': line,
+                        'game_id': game_id_match.group(1)
+                    })
+            pending = None
+            
+            # Look for comment lines with timestamps
+            if line.startswith('#') and ' - ' in line and 'Z' in line:
+                # Extract timestamp from comment
+                timestamp_match = re.search(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}Z)', line)
+                if timestamp_match:
+                    teams = line.split(' - ')[0].replace('#', '').strip()
+                    pending = (teams, timestamp_match.group(1))
     
     return games
 
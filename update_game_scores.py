@@ -4,13 +4,16 @@ Update Game Scores in PostgreSQL
 Calculates home/away scores from player stats after boxscore scraping
 """
 
+import csv
+import io
 import os
 import sys
 import logging
 import psycopg2
-import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import re
 
@@ -30,6 +33,74 @@ DB_CONFIG = {
     'database': 'football_tracker'
 }
 
+# Boxscore CSV filename, e.g. nfl_KC_punt_returns_week1_20250905_401772936.csv
+FILENAME_RE = re.compile(
+    r'^nfl_(?P<team>[A-Z]+)_(?P<category>.+?)_week(?P<week>\d+)_(?:\d{8}|UNKNOWN_DATE)_(?P<game_id>\d+)\.csv$'
+)
+
+def _safe_int(value: Optional[str]) -> int:
+    """Parse a count cell such as '2' or '2.0', treating blank or non-numeric cells as 0"""
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return int(float(value))
+        except (ValueError, OverflowError):
+            return 0
+
+def _sum_td(rows: List[Dict[str, str]]) -> int:
+    """Sum the td column as an integer count"""
+    return sum(_safe_int(row.get('td')) for row in rows)
+
+def _sum_made(rows: List[Dict[str, str]], column: str) -> int:
+    """Sum the 'made' half of a made/attempted column such as fg or xp"""
+    total = 0
+    for row in rows:
+        made, sep, _ = (row.get(column) or '').partition('/')
+        if sep and made.strip().isdigit():
+            total += int(made)
+    return total
+
+def _score_touchdowns(rows: List[Dict[str, str]], team: str, category: str) -> int:
+    """Points from a category's touchdowns"""
+    td_count = _sum_td(rows)
+    logger.debug("%s %s TDs: %s", team, category, td_count)
+    return td_count * 6
+
+def _score_kicking(rows: List[Dict[str, str]], team: str, category: str) -> int:
+    """Points from field goals and extra points (e.g., "2/3" means 2 made)"""
+    fg_made = _sum_made(rows, 'fg')
+    logger.debug("%s FGs made: %s", team, fg_made)
+
+    xp_made = _sum_made(rows, 'xp')
+    logger.debug("%s XPs made: %s", team, xp_made)
+
+    return fg_made * 3 + xp_made
+
+# Scoring handler per stat category. Receiving is deliberately absent:
+# receiving TDs are already counted in passing.
+CATEGORY_HANDLERS = {
+    'passing': _score_touchdowns,
+    'rushing': _score_touchdowns,
+    'defensive': _score_touchdowns,
+    'interceptions': _score_touchdowns,
+    'punt_returns': _score_touchdowns,
+    'kick_returns': _score_touchdowns,
+    'kicking': _score_kicking,
+}
+
+def _category_key(category: str) -> Optional[str]:
+    """Map a filename category such as 'bay passing' to its CATEGORY_HANDLERS key"""
+    for key in CATEGORY_HANDLERS:
+        if category.endswith(key):
+            return key
+    return None
+
+# Worker threads for reading a week's CSVs; scoring is I/O-bound
+SCORE_WORKERS = 8
+
 class GameScoreUpdater:
     def __init__(self, csv_dir: str = None):
         """Initialize the score updater"""
@@ -51,108 +122,65 @@ class GameScoreUpdater:
         try:
             self.conn = psycopg2.connect(**DB_CONFIG)
             self.cursor = self.conn.cursor()
+
+            # Don't wait on the WAL flush at commit. A crash could lose the last
+            # batch of score updates, but they're recomputed from the CSVs anyway.
+            self.cursor.execute("SET synchronous_commit = off")
+
+            # Commit the setup so a later rollback can't undo the SET
+            self.conn.commit()
             logger.info("Connected to database successfully")
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
 
-    def calculate_game_score(self, game_id: str) -> Optional[Tuple[int, int, str, str]]:
+    def _scan_csv_files(self) -> List[Dict]:
         """
-        Calculate total score for a game from player stats CSVs
-        Returns: (home_score, away_score, home_team, away_team)
+        Parse every boxscore CSV filename in the CSV directory once.
+        Returns records with path, team, category, week and game_id.
         """
-        # Find all CSV files for this game
-        pattern = f"*_{game_id}.csv"
-        game_files = list(self.csv_dir.glob(pattern))
-
-        if not game_files:
-            logger.warning(f"No CSV files found for game {game_id}")
-            return None
+        if not self.csv_dir.is_dir():
+            return []
 
-        logger.info(f"Found {len(game_files)} files for game {game_id}")
-
-        # Track scores by team
-        team_scores = {}
-        teams_found = set()
-
-        for csv_file in game_files:
-            try:
-                # Extract team from filename (e.g., nfl_KC_passing_week1_20250905_401772936.csv)
-                filename = csv_file.name
-                match = re.search(r'nfl_([A-Z]+)_', filename)
+        records = []
+        with os.scandir(self.csv_dir) as entries:
+            for entry in entries:
+                match = FILENAME_RE.match(entry.name)
                 if not match:
+                    if entry.name.endswith('.csv'):
+                        logger.warning(f"Skipping unrecognized CSV filename: {entry.name}")
                     continue
+                record = match.groupdict()
+                record['week'] = int(record['week'])
+                record['path'] = entry.path
+                records.append(record)
+        return records
 
-                team = match.group(1)
-                teams_found.add(team)
-
-                if team not in team_scores:
-                    team_scores[team] = 0
-
-                # Read CSV and calculate points based on stat category
-                df = pd.read_csv(csv_file)
-
-                if 'passing' in filename:
-                    # Count passing touchdowns
-                    if 'td' in df.columns:
-                        td_count = df['td'].fillna(0).astype(float).sum()
-                        team_scores[team] += td_count * 6
-                        logger.debug(f"{team} passing TDs: {td_count}")
-
-                elif 'rushing' in filename:
-                    # Count rushing touchdowns
-                    if 'td' in df.columns:
-                        td_count = df['td'].fillna(0).astype(float).sum()
-                        team_scores[team] += td_count * 6
-                        logger.debug(f"{team} rushing TDs: {td_count}")
-
-                elif 'receiving' in filename:
-                    # Receiving TDs are already counted in passing
-                    pass
-
-                elif 'kicking' in filename:
-                    # Count field goals and extra points
-                    if 'fg' in df.columns:
-                        # Parse field goal column (e.g., "2/3" means 2 made)
-                        for fg_str in df['fg'].fillna('0/0'):
-                            if '/' in str(fg_str):
-                                made = int(str(fg_str).split('/')[0])
-                                team_scores[team] += made * 3
-                                logger.debug(f"{team} FGs made: {made}")
-
-                    if 'xp' in df.columns:
-                        # Parse extra points (e.g., "3/3")
-                        for xp_str in df['xp'].fillna('0/0'):
-                            if '/' in str(xp_str):
-                                made = int(str(xp_str).split('/')[0])
-                                team_scores[team] += made
-                                logger.debug(f"{team} XPs made: {made}")
-
-                elif 'defensive' in filename or 'interceptions' in filename:
-                    # Count defensive/return touchdowns if available
-                    if 'td' in df.columns:
-                        td_count = df['td'].fillna(0).astype(float).sum()
-                        team_scores[team] += td_count * 6
-                        logger.debug(f"{team} defensive/return TDs: {td_count}")
-
-                elif 'punt_returns' in filename or 'kick_returns' in filename:
-                    # Count return touchdowns
-                    if 'td' in df.columns:
-                        td_count = df['td'].fillna(0).astype(float).sum()
-                        team_scores[team] += td_count * 6
-                        logger.debug(f"{team} return TDs: {td_count}")
+    def _index_files_by_game(self) -> Dict[str, List[Dict]]:
+        """
+        Scan the CSV directory once and group every file by game ID,
+        whatever week is in its filename
+        """
+        files_by_game = defaultdict(list)
+        for record in self._scan_csv_files():
+            files_by_game[record['game_id']].append(record)
+        return files_by_game
 
-            except Exception as e:
-                logger.error(f"Error processing {csv_file}: {e}")
-                continue
+    def calculate_game_score(self, game_id: str, game_files: List[Dict] = None) -> Optional[Tuple[int, int, str, str]]:
+        """
+        Calculate total score for a game from player stats CSVs
+        Returns: (home_score, away_score, home_team, away_team)
+        """
+        # Find all CSV files for this game unless the caller already has them
+        if game_files is None:
+            game_files = [record for record in self._scan_csv_files() if record['game_id'] == game_id]
 
-        if len(teams_found) != 2:
-            logger.warning(f"Expected 2 teams, found {len(teams_found)}: {teams_found}")
-            if len(teams_found) < 2:
-                return None
+        team_scores = self._calc_team_scores(game_id, game_files)
+        if team_scores is None:
+            return None
 
         # Get the two teams
-        teams = list(teams_found)[:2]
+        teams = list(team_scores)[:2]
 
         # Determine home/away from database
         try:
@@ -185,136 +213,179 @@ class GameScoreUpdater:
             logger.error(f"Error querying database for game {game_id}: {e}")
             return None
 
+    def _calc_team_scores(self, game_id: str, game_files: List[Dict]) -> Optional[Dict[str, int]]:
+        """
+        Total points per team abbreviation from a game's player stats CSVs.
+        Touches no database state; returns None if fewer than two teams have data.
+        """
+        if not game_files:
+            logger.warning(f"No CSV files found for game {game_id}")
+            return None
+
+        logger.info(f"Found {len(game_files)} files for game {game_id}")
+
+        # Track scores by team
+        team_scores = {}
+        teams_found = set()
+
+        for record in game_files:
+            csv_file = record['path']
+            try:
+                team = record['team']
+                category = record['category']
+                teams_found.add(team)
+
+                if team not in team_scores:
+                    team_scores[team] = 0
+
+                key = _category_key(category)
+                if key is None:
+                    continue
+                handler = CATEGORY_HANDLERS[key]
+
+                # Boxscore CSVs are a few dozen rows at most, so the csv module is enough
+                rows = self._read_rows(csv_file)
+                team_scores[team] += handler(rows, team, category)
+
+            except Exception as e:
+                logger.error(f"Error processing {csv_file}: {e}")
+                continue
+
+        if len(teams_found) != 2:
+            logger.warning(f"Expected 2 teams, found {len(teams_found)}: {teams_found}")
+            if len(teams_found) < 2:
+                return None
+
+        return team_scores
+
+    @staticmethod
+    def _read_rows(path: str) -> List[Dict[str, str]]:
+        """Read a boxscore CSV into a list of row dicts"""
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
     def update_game_scores_for_week(self, season: int, week: int):
         """
-        Update scores for all games in a specific week
+        Update scores for all games in a specific week: unscored (0-0) regular
+        season games, plus any game with CSV data whose stored score is wrong
         """
         logger.info(f"Updating scores for Season {season}, Week {week}")
 
         try:
-            # Get all games for this week that need score updates
+            # One directory scan serves every game. Scores use all of a game's files,
+            # since CSVs can be filed under a different week than the DB has.
+            files_by_game = self._index_files_by_game()
+
+            # Games with CSVs tagged for this week are checked even if already scored
+            week_game_ids = [
+                game_id for game_id, records in files_by_game.items()
+                if any(record['week'] == week for record in records)
+            ]
+            logger.info(f"Found CSV data for {len(week_game_ids)} games in week {week}")
+
+            # Fetch every candidate game in a single query
             self.cursor.execute("""
                 SELECT g.id, g.game_id, g.home_score, g.away_score,
                        ht.abbreviation as home_team,
-                       at.abbreviation as away_team
+                       at.abbreviation as away_team,
+                       (g.week = %s AND g.season_type = 'regular'
+                        AND g.home_score = 0 AND g.away_score = 0) as unscored
                 FROM games g
                 JOIN teams ht ON g.home_team_id = ht.id
                 JOIN teams at ON g.away_team_id = at.id
-                WHERE g.season = %s AND g.week = %s
-                  AND g.season_type = 'regular'
-                  AND (g.home_score = 0 AND g.away_score = 0)
-            """, (season, week))
+                WHERE g.season = %s
+                  AND ((g.week = %s AND g.season_type = 'regular'
+                        AND g.home_score = 0 AND g.away_score = 0)
+                       OR g.game_id = ANY(%s))
+            """, (week, season, week, week_game_ids))
 
             games = self.cursor.fetchall()
-            logger.info(f"Found {len(games)} games needing score updates")
-
-            updated_count = 0
-            for game_row in games:
-                game_db_id, game_id, current_home, current_away, home_team, away_team = game_row
-
-                # Calculate scores from CSV files
-                score_data = self.calculate_game_score(game_id)
-
-                if score_data:
-                    home_score, away_score, _, _ = score_data
+            logger.info(f"Found {len(games)} games to check")
+
+            # Calculate scores from CSV files, once per game, in parallel.
+            # Workers only read files; the DB connection stays on this thread.
+            game_ids = [game_row[1] for game_row in games]
+            with ThreadPoolExecutor(max_workers=SCORE_WORKERS) as executor:
+                all_scores = list(executor.map(
+                    lambda game_id: self._calc_team_scores(game_id, files_by_game.get(game_id, [])),
+                    game_ids
+                ))
+
+            score_rows = []
+            for game_row, team_scores in zip(games, all_scores):
+                game_db_id, game_id, current_home, current_away, home_team, away_team, unscored = game_row
+
+                if team_scores is None:
+                    if unscored:
+                        logger.warning(f"Could not calculate scores for game {game_id}")
+                    continue
 
-                    # Update the database (convert to int to avoid numpy type issues)
-                    self.cursor.execute("""
-                        UPDATE games
-                        SET home_score = %s,
-                            away_score = %s,
-                            completed = true,
-                            updated_at = NOW()
-                        WHERE id = %s
-                    """, (int(home_score), int(away_score), game_db_id))
+                home_score = team_scores.get(home_team, 0)
+                away_score = team_scores.get(away_team, 0)
 
+                if unscored:
+                    score_rows.append((game_db_id, home_score, away_score))
                     logger.info(f"Updated game {game_id}: {away_team} {away_score} @ {home_team} {home_score}")
-                    updated_count += 1
-                else:
-                    logger.warning(f"Could not calculate scores for game {game_id}")
+                elif home_score != current_home or away_score != current_away:
+                    score_rows.append((game_db_id, home_score, away_score))
+                    logger.info(f"Corrected scores for game {game_id}: {away_score}-{home_score} (was {current_away}-{current_home})")
 
-            # Commit all updates
+            # Write all updates in one batch and commit
+            updated_count = self._bulk_update_scores(score_rows)
             self.conn.commit()
             logger.info(f"Successfully updated {updated_count} games")
 
-            # Also update games that might have CSV data but aren't marked as 0-0
-            self._update_additional_games(season, week)
-
         except Exception as e:
             logger.error(f"Error updating game scores: {e}")
             self.conn.rollback()
             raise
 
-    def _update_additional_games(self, season: int, week: int):
+    def _bulk_update_scores(self, score_rows) -> int:
         """
-        Check for games that might have been marked completed but have wrong scores
+        Apply (game_db_id, home_score, away_score) rows in a single batch:
+        COPY them into a temp table and run one UPDATE ... FROM against games.
+        The temp table is dropped when the caller commits.
         """
-        try:
-            # Find all CSV files for this week
-            pattern = f"*_week{week}_*.csv"
-            week_files = list(self.csv_dir.glob(pattern))
-
-            # Extract unique game IDs
-            game_ids = set()
-            for f in week_files:
-                match = re.search(r'_(\d{9})\.csv$', f.name)
-                if match:
-                    game_ids.add(match.group(1))
-
-            logger.info(f"Found CSV data for {len(game_ids)} games in week {week}")
-
-            for game_id in game_ids:
-                # Check if this game needs updating
-                self.cursor.execute("""
-                    SELECT id, home_score, away_score
-                    FROM games
-                    WHERE game_id = %s AND season = %s
-                """, (game_id, season))
-
-                result = self.cursor.fetchone()
-                if result:
-                    db_id, current_home, current_away = result
-
-                    # Calculate actual scores
-                    score_data = self.calculate_game_score(game_id)
-                    if score_data:
-                        calc_home, calc_away, _, _ = score_data
-
-                        # Update if different
-                        if calc_home != current_home or calc_away != current_away:
-                            self.cursor.execute("""
-                                UPDATE games
-                                SET home_score = %s,
-                                    away_score = %s,
-                                    completed = true,
-                                    updated_at = NOW()
-                                WHERE id = %s
-                            """, (int(calc_home), int(calc_away), db_id))
-
-                            logger.info(f"Corrected scores for game {game_id}: {calc_away}-{calc_home} (was {current_away}-{current_home})")
-
-            self.conn.commit()
-
-        except Exception as e:
-            logger.error(f"Error in additional game updates: {e}")
+        if not score_rows:
+            return 0
+
+        buffer = io.StringIO()
+        for game_db_id, home_score, away_score in score_rows:
+            buffer.write(f"{game_db_id}\t{home_score}\t{away_score}\n")
+        buffer.seek(0)
+
+        self.cursor.execute("""
+            CREATE TEMP TABLE tmp_scores (
+                id INTEGER,
+                home INTEGER,
+                away INTEGER
+            ) ON COMMIT DROP
+        """)
+        self.cursor.copy_from(buffer, 'tmp_scores', columns=('id', 'home', 'away'))
+
+        self.cursor.execute("""
+            UPDATE games g
+            SET home_score = t.home,
+                away_score = t.away,
+                completed = true,
+                updated_at = NOW()
+            FROM tmp_scores t
+            WHERE g.id = t.id
+        """)
+        return self.cursor.rowcount
 
     def update_latest_week(self):
         """
         Update scores for the most recent week with CSV data
         """
         # Find the latest week with CSV files
-        csv_files = list(self.csv_dir.glob("nfl_*_week*.csv"))
+        csv_files = self._scan_csv_files()
 
         if not csv_files:
             logger.warning("No CSV files found")
             return
 
-        # Extract week numbers
-        weeks = set()
-        for f in csv_files:
-            match = re.search(r'_week(\d+)_', f.name)
-            if match:
-                weeks.add(int(match.group(1)))
+        weeks = {record['week'] for record in csv_files}
 
         if weeks:
             latest_week = max(weeks)